@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+startup_bench.py
+Time-to-first-paint / time-to-interactive of App on a large vault, baseline vs current.
+
+    python bench/startup_bench.py [rows] [baseline-rev]
+
+Needs a display (run under Xvfb on CI: xvfb-run python bench/startup_bench.py).
+The baseline main.py is taken from git (default: the root commit).
+"""
+
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a child process: import the given main.py, build App, report timings, quit.
+CHILD = r"""
+import importlib.util, json, sys, time
+t0 = time.perf_counter()
+spec = importlib.util.spec_from_file_location("app_main", sys.argv[1])
+mod = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(mod)
+app = mod.App()
+marks = {}
+
+def on_expose(_evt):
+    if "first_paint" not in marks:
+        app.update_idletasks()
+        marks["first_paint"] = (time.perf_counter() - t0) * 1000
+
+app.bind("<Expose>", on_expose, add="+")
+
+def poll():
+    metrics = getattr(app, "startup_metrics", None)
+    if metrics is None:
+        # Baseline: everything is loaded before the window appears
+        if "first_paint" in marks:
+            marks["interactive"] = marks["loaded"] = marks["first_paint"]
+    else:
+        for key in ("interactive", "loaded"):
+            if key in metrics:
+                marks[key] = metrics[key] + (app._t0 - t0) * 1000
+    if "loaded" in marks:
+        print(json.dumps(marks))
+        app.destroy()
+        return
+    app.after(10, poll)
+
+app.after(10, poll)
+app.mainloop()
+"""
+
+
+def make_vault(program_data, rows):
+    data_dir = os.path.join(program_data, "ValorantAccountSwitcher")
+    os.makedirs(data_dir, exist_ok=True)
+    conn = sqlite3.connect(os.path.join(data_dir, "simple_accounts.db"))
+    conn.execute("""
+        CREATE TABLE accounts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nickname TEXT NOT NULL UNIQUE,
+            username TEXT NOT NULL,
+            password TEXT NOT NULL
+        )
+    """)
+    conn.executemany("INSERT INTO accounts (nickname, username, password) VALUES (?, ?, ?)",
+                     [(f"Nick{i}", f"user{i}", f"pw{i}") for i in range(rows)])
+    conn.commit()
+    conn.close()
+    with open(os.path.join(data_dir, "last_account.txt"), "w", encoding="utf-8") as f:
+        f.write(str(rows // 2))
+
+
+def run(main_path, rows):
+    program_data = tempfile.mkdtemp()
+    make_vault(program_data, rows)
+    env = dict(os.environ, PROGRAMDATA=program_data)
+    out = subprocess.run([sys.executable, "-c", CHILD, main_path], env=env, cwd=ROOT,
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        sys.exit("No display: run under Xvfb, e.g. xvfb-run python bench/startup_bench.py")
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rev = sys.argv[2] if len(sys.argv) > 2 else subprocess.run(
+        ["git", "rev-list", "--max-parents=0", "HEAD"], cwd=ROOT, capture_output=True, text=True
+    ).stdout.split()[0]
+    baseline = os.path.join(tempfile.mkdtemp(), "main.py")
+    with open(baseline, "w", encoding="utf-8") as f:
+        f.write(subprocess.run(["git", "show", f"{rev}:main.py"], cwd=ROOT,
+                               capture_output=True, text=True, check=True).stdout)
+
+    print(f"{rows} accounts")
+    for label, path in (("baseline", baseline), ("current", os.path.join(ROOT, "main.py"))):
+        m = run(path, rows)
+        print(f"{label:9} first_paint {m['first_paint']:8.0f} ms | interactive {m['interactive']:8.0f} ms"
+              f" | loaded {m['loaded']:8.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
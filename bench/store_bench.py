@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+store_bench.py
+Memory/allocation benchmark: AccountStore vs the old list-of-tuples rows.
+
+    python bench/store_bench.py [rows]
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Keep main.py's app-data directory out of the real ProgramData/home
+os.environ["PROGRAMDATA"] = tempfile.mkdtemp()
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main  # noqa: E402
+
+TERM = "ick9"
+
+
+def traced(fn):
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current / 1e6, peak / 1e6
+
+
+def timed(fn, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def load_store(db):
+    # How App reloads: stream chunks instead of materializing every tuple at once
+    store = main.AccountStore()
+    for rows in db.iter_chunks(main.STARTUP_CHUNK * 10):
+        store.extend(rows)
+    return store
+
+
+def main_bench(n):
+    db = main.SimpleDB(":memory:")
+    with db.conn:
+        db.conn.executemany("INSERT INTO accounts (nickname, username, password) VALUES (?, ?, ?)",
+                            [(f"Nick{i}", f"user{i}", f"pw{i}") for i in range(n)])
+
+    # Resident size of the in-memory representation (strings included)
+    rows, rows_mb, rows_peak = traced(db.all)
+    store, store_mb, store_peak = traced(lambda: load_store(db))
+    print(f"{n} rows")
+    print(f"resident   tuples {rows_mb:7.2f} MB (peak {rows_peak:.2f}) | "
+          f"store {store_mb:7.2f} MB (peak {store_peak:.2f})")
+
+    # Per search keystroke: old path re-read the DB and lowercased every nickname
+    def old_keystroke():
+        return [r for r in db.all() if TERM in r[1].lower()]
+
+    def new_keystroke():
+        return store.view(TERM)
+
+    _, _, old_peak = traced(old_keystroke)
+    _, _, new_peak = traced(new_keystroke)
+    print(f"keystroke  tuples {timed(old_keystroke):7.1f} ms, {old_peak:6.2f} MB allocated | "
+          f"store {timed(new_keystroke):7.1f} ms, {new_peak:6.2f} MB allocated")
+
+    # Per edit: old path reloaded every row; the store patches the one that changed
+    last_id = rows[-1][0]
+
+    def old_edit():
+        all_rows = db.all()
+        return [r for r in all_rows if "" in r[1].lower()]
+
+    def new_edit():
+        store.upsert(last_id, "Renamed", "user", "pw")
+        return store.view("")
+
+    _, _, old_peak = traced(old_edit)
+    _, _, new_peak = traced(new_edit)
+    print(f"edit       tuples {timed(old_edit):7.1f} ms, {old_peak:6.2f} MB allocated | "
+          f"store {timed(new_edit):7.1f} ms, {new_peak:6.2f} MB allocated")
+
+    # Filtered view size
+    print(f"view       list {sys.getsizeof(old_keystroke())} B | array {sys.getsizeof(new_keystroke())} B")
+
+    # Last-account lookup (memoized after the first scan)
+    print(f"lookup     scan {timed(lambda: next(r for r in rows if r[0] == last_id), 20):.3f} ms | "
+          f"store {timed(lambda: store.position(last_id), 20):.3f} ms")
+
+
+if __name__ == "__main__":
+    main_bench(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -8,12 +8,18 @@ Minimal local account saver (Nickname, Username, Password)
 
 import os
 import sys
+import json
+import ntpath
 import sqlite3
 import subprocess
 import time
-import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
 import tkinter as tk
-from tkinter import ttk, messagebox, font as tkfont, filedialog
+from tkinter import ttk, messagebox, font as tkfont, filedialog, simpledialog
 
 # --- pyautogui for keystrokes ---
 try:
@@ -32,11 +38,17 @@ except Exception:
 
 DB = "simple_accounts.db"
 RIOT_PATH_DEFAULT = r"C:\Riot Games\Riot Client\RiotClientServices.exe"  # fallback default path
+RIOT_EXE_NAME = "RiotClientServices.exe"
 
 # Choose paste key per OS
 IS_MAC = sys.platform == "darwin"
 PASTE_MOD = "command" if IS_MAC else "ctrl"
 APP_NAME = "ValorantAccountSwitcher"
+JOURNAL_RETENTION_DAYS = 30  # journal entries older than this are compacted away on startup
+UNDO_LIMIT = 50  # max undo/redo steps kept in the UI
+STORE_PATCH_LIMIT = 20  # bigger change batches reload the account store instead of patching it
+STARTUP_CHUNK = 500  # accounts streamed into the list per event-loop turn at startup
+STARTUP_METRICS = bool(os.environ.get("VAS_STARTUP_METRICS"))  # print startup timings to stderr
 
 
 def get_app_dir():
@@ -60,13 +72,16 @@ def get_riot_path_file():
 
 DB_PATH = get_default_db_path()
 RIOT_PATH_FILE = get_riot_path_file()
+RIOT_PATH_CACHE_FILE = os.path.join(get_app_dir(), "riot_path_cache.json")
 LAST_ACCOUNT_FILE = os.path.join(get_app_dir(), "last_account.txt")
 
 # ---------------- Data layer ----------------
 class SimpleDB:
     def __init__(self, path=DB_PATH):
+        self.path = path
         self.conn = sqlite3.connect(path)
         self._ensure_table()
+        self.compact()
 
     def _ensure_table(self):
         self.conn.execute("""
@@ -77,31 +92,498 @@ class SimpleDB:
                 password TEXT NOT NULL
             )
         """)
+        # Append-only change journal: before/after image of every mutation
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS journal (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                ts REAL NOT NULL,
+                op TEXT NOT NULL,
+                account_id INTEGER NOT NULL,
+                before TEXT,
+                after TEXT
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS journal_ts ON journal (ts)")
+        # Lets the ordered listing stream its first rows without sorting the whole table
+        self.conn.execute("CREATE INDEX IF NOT EXISTS accounts_nickname_nocase ON accounts (nickname COLLATE NOCASE)")
         self.conn.commit()
 
-    def add(self, nickname, username, password):
-        cur = self.conn.cursor()
-        cur.execute("INSERT INTO accounts (nickname, username, password) VALUES (?, ?, ?)",
-                    (nickname, username, password))
-        self.conn.commit()
-
-    def update(self, rowid, nickname, username, password):
-        self.conn.execute("UPDATE accounts SET nickname=?, username=?, password=? WHERE id=?",
-                          (nickname, username, password, rowid))
-        self.conn.commit()
-
-    def delete(self, rowid):
-        self.conn.execute("DELETE FROM accounts WHERE id=?", (rowid,))
-        self.conn.commit()
+    # ---------- journal helpers ----------
+    def _image(self, rowid):
+        row = self.conn.execute("SELECT nickname, username, password FROM accounts WHERE id=?",
+                                (rowid,)).fetchone()
+        return list(row) if row else None
+
+    def _journal(self, op, rowid, before, after) -> int:
+        cur = self.conn.execute(
+            "INSERT INTO journal (ts, op, account_id, before, after) VALUES (?, ?, ?, ?, ?)",
+            (time.time(), op, rowid,
+             json.dumps(before) if before is not None else None,
+             json.dumps(after) if after is not None else None))
+        return cur.lastrowid
+
+    def _apply(self, rowid, image):
+        # Bring account `rowid` to `image` (None = absent)
+        if image is None:
+            self.conn.execute("DELETE FROM accounts WHERE id=?", (rowid,))
+            return
+        self.conn.execute(
+            "INSERT INTO accounts (id, nickname, username, password) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET nickname=excluded.nickname, "
+            "username=excluded.username, password=excluded.password",
+            (rowid, *image))
+
+    def _entry(self, seq):
+        row = self.conn.execute("SELECT account_id, before, after FROM journal WHERE seq=?", (seq,)).fetchone()
+        if not row:
+            raise KeyError(seq)
+        rowid, before, after = row
+        return rowid, json.loads(before) if before else None, json.loads(after) if after else None
+
+    # ---------- mutations (each returns its journal seq) ----------
+    def add(self, nickname, username, password) -> int:
+        with self.conn:
+            cur = self.conn.execute("INSERT INTO accounts (nickname, username, password) VALUES (?, ?, ?)",
+                                    (nickname, username, password))
+            return self._journal("add", cur.lastrowid, None, [nickname, username, password])
+
+    def update(self, rowid, nickname, username, password) -> int:
+        with self.conn:
+            before = self._image(rowid)
+            self.conn.execute("UPDATE accounts SET nickname=?, username=?, password=? WHERE id=?",
+                              (nickname, username, password, rowid))
+            return self._journal("update", rowid, before, [nickname, username, password])
+
+    def delete(self, rowid) -> int:
+        with self.conn:
+            before = self._image(rowid)
+            self.conn.execute("DELETE FROM accounts WHERE id=?", (rowid,))
+            return self._journal("delete", rowid, before, None)
+
+    def revert(self, seqs) -> list:
+        """Undo journal entries `seqs` (newest last) in one transaction by restoring their before images."""
+        done = []
+        with self.conn:
+            for seq in reversed(seqs):
+                rowid, before, _after = self._entry(seq)
+                current = self._image(rowid)
+                self._apply(rowid, before)
+                done.append(self._journal("undo", rowid, current, before))
+        return done
+
+    def reapply(self, seqs) -> list:
+        """Redo journal entries `seqs` in one transaction by restoring their after images."""
+        done = []
+        with self.conn:
+            for seq in seqs:
+                rowid, _before, after = self._entry(seq)
+                current = self._image(rowid)
+                self._apply(rowid, after)
+                done.append(self._journal("redo", rowid, current, after))
+        return done
+
+    def changes(self, seqs):
+        """(account_id, after image) for journal entries `seqs`, in order."""
+        changes = []
+        for seq in seqs:
+            rowid, _before, after = self._entry(seq)
+            changes.append((rowid, after))
+        return changes
+
+    def history_start(self):
+        """Earliest time restore_to() can reach, or None if there is no history yet.
+
+        Earlier changes were either compacted away or made before the journal existed.
+        """
+        oldest = self.conn.execute("SELECT MIN(ts) FROM journal").fetchone()[0]
+        if oldest is None:
+            return None
+        return max(oldest, time.time() - JOURNAL_RETENTION_DAYS * 86400)
+
+    def restore_to(self, ts: float) -> int:
+        """Roll every account back to its state at `ts`. Returns number of accounts changed.
+
+        Raises ValueError if `ts` is older than history_start().
+        """
+        start = self.history_start()
+        if start is None or ts < start:
+            raise ValueError("No change history that far back.")
+        rows = self.conn.execute(
+            "SELECT account_id, before FROM journal WHERE ts > ? ORDER BY seq", (ts,)).fetchall()
+        # Earliest entry after `ts` holds the image each account had at `ts`
+        targets = {}
+        for rowid, before in rows:
+            if rowid not in targets:
+                targets[rowid] = json.loads(before) if before else None
+        changed = []
+        with self.conn:
+            # Clear every changed row first so restored nicknames can't collide with later renames
+            for rowid, image in targets.items():
+                current = self._image(rowid)
+                if current == image:
+                    continue
+                self.conn.execute("DELETE FROM accounts WHERE id=?", (rowid,))
+                self._journal("restore", rowid, current, image)
+                changed.append((rowid, image))
+            for rowid, image in changed:
+                self._apply(rowid, image)
+        return len(changed)
+
+    def replace_all(self, rows) -> list:
+        """Replace every account with `rows` (nickname, username, password), journaled as deletes + adds."""
+        seqs = []
+        with self.conn:
+            for (rowid,) in self.conn.execute("SELECT id FROM accounts").fetchall():
+                before = self._image(rowid)
+                self.conn.execute("DELETE FROM accounts WHERE id=?", (rowid,))
+                seqs.append(self._journal("delete", rowid, before, None))
+            for nick, user, pw in rows:
+                cur = self.conn.execute("INSERT INTO accounts (nickname, username, password) VALUES (?, ?, ?)",
+                                        (nick, user, pw))
+                seqs.append(self._journal("add", cur.lastrowid, None, [nick, user, pw]))
+        return seqs
+
+    def export(self, path):
+        """Write the accounts, without the journal history, to a fresh DB at `path`."""
+        if os.path.abspath(path) == os.path.abspath(self.path):
+            raise ValueError("Choose a different file than the live database.")
+        if os.path.exists(path):
+            os.remove(path)
+        dest = sqlite3.connect(path)
+        try:
+            with dest:
+                dest.execute("""
+                    CREATE TABLE accounts (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        nickname TEXT NOT NULL UNIQUE,
+                        username TEXT NOT NULL,
+                        password TEXT NOT NULL
+                    )
+                """)
+                dest.executemany("INSERT INTO accounts (id, nickname, username, password) VALUES (?, ?, ?, ?)",
+                                 self.all())
+        finally:
+            dest.close()
+
+    def compact(self, keep_days=JOURNAL_RETENTION_DAYS):
+        cutoff = time.time() - keep_days * 86400
+        with self.conn:
+            removed = self.conn.execute("DELETE FROM journal WHERE ts < ?", (cutoff,)).rowcount
+        if removed > 0:
+            # Give the space (and the old before/after images) back to the filesystem
+            self.conn.execute("VACUUM")
 
     def all(self):
         cur = self.conn.cursor()
         cur.execute("SELECT id, nickname, username, password FROM accounts ORDER BY nickname COLLATE NOCASE")
         return cur.fetchall()
 
+    def iter_chunks(self, size):
+        """Same rows as all(), yielded in lists of at most `size`."""
+        cur = self.conn.cursor()
+        cur.execute("SELECT id, nickname, username, password FROM accounts ORDER BY nickname COLLATE NOCASE")
+        while True:
+            rows = cur.fetchmany(size)
+            if not rows:
+                return
+            yield rows
+
+    def get(self, rowid):
+        return self.conn.execute("SELECT id, nickname, username, password FROM accounts WHERE id=?",
+                                 (rowid,)).fetchone()
+
+class TextColumn:
+    """A column of strings packed into one str.
+
+    Row i is blob[offsets[i]:offsets[i + 1] - 1]; each value is followed by a NUL so
+    a substring search can't match across two rows.
+    """
+
+    def __init__(self, values=()):
+        self.blob = ""
+        self.offsets = array("q", [0])
+        self.extend(values)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.blob[self.offsets[i]:self.offsets[i + 1] - 1]
+
+    def extend(self, values):
+        values = list(values)
+        if not values:
+            return
+        end = self.offsets[-1]
+        for value in values:
+            end += len(value) + 1
+            self.offsets.append(end)
+        self.blob += "\0".join(values) + "\0"
+
+    def insert(self, i, value):
+        at, grow = self.offsets[i], len(value) + 1
+        self.blob = self.blob[:at] + value + "\0" + self.blob[at:]
+        self.offsets[i + 1:] = array("q", [o + grow for o in self.offsets[i:]])
+
+    def pop(self, i):
+        start, end = self.offsets[i], self.offsets[i + 1]
+        self.blob = self.blob[:start] + self.blob[end:]
+        self.offsets[i:] = array("q", [o - (end - start) for o in self.offsets[i + 1:]])
+
+    def find(self, term, start=0):
+        """Indices of rows from `start` on that contain `term`."""
+        blob, offsets = self.blob, self.offsets
+        found = array("l")
+        pos = offsets[start]
+        while True:
+            pos = blob.find(term, pos)
+            if pos < 0:
+                return found
+            row = bisect_right(offsets, pos) - 1
+            found.append(row)
+            pos = offsets[row + 1]
+
+
+# SQLite's NOCASE collation only folds ASCII letters
+_NOCASE = {c: c + 32 for c in range(ord("A"), ord("Z") + 1)}
+
+
+def _nocase(text):
+    return text.translate(_NOCASE)
+
+
+class AccountStore:
+    """Columnar in-memory copy of the accounts table, in nickname (NOCASE) order.
+
+    Nicknames stay a list of str for the listbox; ids live in an array and the
+    case-folded search keys, usernames and passwords are packed TextColumns, so
+    there is no per-row tuple, int or extra string object. Filtered views are
+    index arrays into the columns rather than copied rows.
+    """
+
+    def __init__(self, rows=()):
+        self.load(rows)
+
+    def load(self, rows):
+        self.ids = array("q")
+        self.nicknames = []
+        self.keys = TextColumn()
+        self.usernames = TextColumn()
+        self.passwords = TextColumn()
+        self._last = None  # (account_id, index) memo for position()
+        self.extend(rows)
+
+    def extend(self, rows):
+        """Append rows that sort after the current ones (as streamed from SimpleDB)."""
+        rows = list(rows)
+        self.ids.extend(r[0] for r in rows)
+        self.nicknames.extend(r[1] for r in rows)
+        self.keys.extend(r[1].casefold() for r in rows)
+        self.usernames.extend(r[2] for r in rows)
+        self.passwords.extend(r[3] for r in rows)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def row(self, i):
+        return self.ids[i], self.nicknames[i], self.usernames[i], self.passwords[i]
+
+    def position(self, account_id):
+        """Store index of `account_id`, or None. Only the last used account is looked
+        up repeatedly, so the scan result is memoized until the store changes."""
+        if self._last and self._last[0] == account_id and self._last[1] < len(self.ids) \
+                and self.ids[self._last[1]] == account_id:
+            return self._last[1]
+        try:
+            pos = self.ids.index(account_id)
+        except ValueError:
+            return None
+        self._last = (account_id, pos)
+        return pos
+
+    def remove(self, account_id):
+        pos = self.position(account_id)
+        if pos is None:
+            return
+        del self.ids[pos]
+        del self.nicknames[pos]
+        self.keys.pop(pos)
+        self.usernames.pop(pos)
+        self.passwords.pop(pos)
+        self._last = None
+
+    def upsert(self, account_id, nickname, username, password):
+        """Insert or replace one account, keeping nickname order."""
+        self.remove(account_id)
+        pos = bisect_right(self.nicknames, _nocase(nickname), key=_nocase)
+        self.ids.insert(pos, account_id)
+        self.nicknames.insert(pos, nickname)
+        self.keys.insert(pos, nickname.casefold())
+        self.usernames.insert(pos, username)
+        self.passwords.insert(pos, password)
+        self._last = (account_id, pos)
+
+    def view(self, term="", start=0):
+        """Indices from `start` on whose nickname contains `term` (already case-folded)."""
+        term = term.replace("\0", "")
+        if not term:
+            return array("l", range(start, len(self.ids)))
+        return self.keys.find(term, start)
+
+# ---------------- Riot Client discovery ----------------
+class LocalFS:
+    """Filesystem access used by RiotLocator; pass a fake with the same methods to test discovery."""
+
+    def stat(self, path):
+        """(size, mtime_ns) for a regular file, else None."""
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def read_text(self, path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+        except (OSError, ValueError):
+            return None
+
+    def write_text(self, path, text):
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        except OSError:
+            pass
+
+
+class RiotLocator:
+    """Finds RiotClientServices.exe and caches it with its file metadata.
+
+    A cached path whose (size, mtime) still match is trusted after a single stat.
+    If the metadata changed the file is re-validated; if it is gone or no longer valid,
+    Riot's install manifest and the known install locations are probed in parallel.
+    Install paths are Windows paths and are built with ntpath on every platform.
+    A failed discovery is cached too, keyed on the manifest's metadata: it is only
+    retried once Riot (re)writes its manifest, i.e. after an install.
+    """
+
+    def __init__(self, fs=None, cache_file=RIOT_PATH_CACHE_FILE, env=None):
+        self.fs = fs or LocalFS()
+        self.cache_file = cache_file
+        self.env = os.environ if env is None else env
+        self._cache = None  # {"path", "size", "mtime_ns"} or {"path": "", "manifest"}, loaded on first use
+
+    def _load_cache(self):
+        if self._cache is None:
+            try:
+                data = json.loads(self.fs.read_text(self.cache_file) or "{}")
+                self._cache = data if isinstance(data.get("path"), str) else {}
+            except (ValueError, AttributeError):
+                self._cache = {}
+        return self._cache
+
+    @staticmethod
+    def _valid(path, meta) -> bool:
+        return bool(meta) and meta[0] > 0 and ntpath.basename(path).lower() == RIOT_EXE_NAME.lower()
+
+    def _store(self, path, meta):
+        self._cache = {"path": path, "size": meta[0], "mtime_ns": meta[1]}
+        self.fs.write_text(self.cache_file, json.dumps(self._cache))
+
+    def manifest_file(self):
+        # Riot writes its client locations to %ProgramData%\Riot Games\RiotClientInstalls.json
+        program_data = self.env.get("PROGRAMDATA") or self.env.get("ProgramData")
+        if not program_data:
+            return ""
+        return ntpath.join(program_data, "Riot Games", "RiotClientInstalls.json")
+
+    def _manifest_meta(self):
+        manifest = self.manifest_file()
+        meta = self.fs.stat(manifest) if manifest else None
+        return list(meta) if meta else None  # JSON-shaped, for comparison with the cache
+
+    def manifest_paths(self):
+        manifest = self.manifest_file()
+        if not manifest:
+            return []
+        text = self.fs.read_text(manifest)
+        try:
+            data = json.loads(text) if text else {}
+        except ValueError:
+            return []
+        if not isinstance(data, dict):
+            return []
+        # Entries use forward slashes ("C:/Riot Games/...")
+        return [ntpath.normpath(data[k]) for k in ("rc_default", "rc_live", "rc_beta")
+                if isinstance(data.get(k), str) and data[k]]
+
+    def known_paths(self):
+        roots = [self.env.get("ProgramFiles"), self.env.get("ProgramFiles(x86)"), self.env.get("SystemDrive")]
+        paths = [RIOT_PATH_DEFAULT]
+        for root in roots:
+            if root:
+                paths.append(ntpath.join(root + ("\\" if root.endswith(":") else ""),
+                                         "Riot Games", "Riot Client", RIOT_EXE_NAME))
+        return paths
+
+    def discover(self, preferred=()):
+        """Probe candidates in parallel; returns (path, meta) for the first valid hit in priority order.
+
+        The manifest is read alongside the stats of the preferred/known paths; its
+        entries are then stat'ed in a second parallel round.
+        """
+        preferred = [p for p in preferred if p]
+        fixed = list(dict.fromkeys((*preferred, *self.known_paths())))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            manifest_future = pool.submit(self.manifest_paths)
+            fixed_stats = pool.map(self.fs.stat, fixed)
+            manifest = manifest_future.result()
+            extra = [p for p in dict.fromkeys(manifest) if p not in fixed]
+            metas = dict(zip(fixed, fixed_stats))
+            metas.update(zip(extra, pool.map(self.fs.stat, extra)))
+        for path in dict.fromkeys((*preferred, *manifest, *self.known_paths())):
+            if self._valid(path, metas.get(path)):
+                return path, metas[path]
+        return "", None
+
+    def resolve(self, preferred=()) -> str:
+        """Cached Riot Client path, re-discovering only if the cached file changed or vanished."""
+        cached = self._load_cache()
+        if cached and not cached["path"]:
+            # Known miss: don't probe again until the manifest changes
+            if self._manifest_meta() == cached.get("manifest"):
+                return ""
+        elif cached:
+            meta = self.fs.stat(cached["path"])
+            if meta == (cached.get("size"), cached.get("mtime_ns")):
+                return cached["path"]
+            if self._valid(cached["path"], meta):
+                # Changed but still a Riot Client exe (e.g. Riot patched itself)
+                self._store(cached["path"], meta)
+                return cached["path"]
+        path, meta = self.discover(preferred)
+        if path:
+            self._store(path, meta)
+        else:
+            self._cache = {"path": "", "manifest": self._manifest_meta()}
+            self.fs.write_text(self.cache_file, json.dumps(self._cache))
+        return path
+
+    def remember(self, path) -> bool:
+        meta = self.fs.stat(path)
+        if not self._valid(path, meta):
+            return False
+        self._store(path, meta)
+        return True
+
 # ---------------- UI ----------------
 class App(tk.Tk):
     def __init__(self):
+        self._t0 = time.perf_counter()
+        self.startup_metrics = {}
         super().__init__()
         # Keep the standard Windows title bar instead of a custom header
         self.overrideredirect(False)
@@ -112,16 +594,26 @@ class App(tk.Tk):
         self._set_icon(self)
         self._setup_style()
         self.db = SimpleDB()
-        self.riot_path = self._load_riot_path()
+        self.riot_locator = RiotLocator()
+        self.riot_path = None  # resolved in a worker after first paint, see _resolve_riot_path
+        self.riot_future = None
         self.current_id = None
-        self.rows = []
-        self.all_rows = []
+        self.store = AccountStore()
+        self.view = array("l")  # listbox index -> store index
         self.status_after_id = None
+        self.loader = None
+        self.loader_after_id = None
         self.last_account_id = self._load_last_account()
+        # Journal seqs for bounded undo/redo
+        self.undo_stack = deque(maxlen=UNDO_LIMIT)
+        self.redo_stack = deque(maxlen=UNDO_LIMIT)
 
         self._build_ui()
-        self._refresh_list()
+        # Accounts are streamed in once the window has been painted (see _on_first_expose)
+        self.bind("<Expose>", self._on_first_expose, add="+")
         self.bind("<Return>", lambda _e: self.launch_riot())
+        self.bind("<Control-z>", lambda e: self._on_history_key(e, self.undo))
+        self.bind("<Control-y>", lambda e: self._on_history_key(e, self.redo))
 
     def _set_icon(self, window):
         try:
@@ -299,6 +791,10 @@ class App(tk.Tk):
         db_menu["menu"] = db_menu.menu
         db_menu.menu.add_command(label="Import DB", command=self.import_db)
         db_menu.menu.add_command(label="Export DB", command=self.export_db)
+        db_menu.menu.add_separator()
+        db_menu.menu.add_command(label="Undo", accelerator="Ctrl+Z", command=self.undo)
+        db_menu.menu.add_command(label="Redo", accelerator="Ctrl+Y", command=self.redo)
+        db_menu.menu.add_command(label="Restore to...", command=self.restore_db)
 
         self.toast_label = ttk.Label(right, text="", style="Status.TLabel")
         self.toast_label.grid(row=10, column=0, columnspan=3, sticky="e", pady=(6, 0))
@@ -338,21 +834,43 @@ class App(tk.Tk):
             pass
 
     def _load_riot_path(self) -> str:
+        # Path picked by the user before discovery existed; tried first when the cache is empty
         try:
             if os.path.exists(RIOT_PATH_FILE):
-                return open(RIOT_PATH_FILE, "r", encoding="utf-8").read().strip() or RIOT_PATH_DEFAULT
+                return open(RIOT_PATH_FILE, "r", encoding="utf-8").read().strip()
         except Exception:
             pass
-        return RIOT_PATH_DEFAULT
+        return ""
+
+    def _resolve_riot_path(self):
+        # Discovery may stat slow/network drives, so it runs off the Tk thread
+        pool = ThreadPoolExecutor(max_workers=1)
+        self.riot_future = pool.submit(self.riot_locator.resolve, (self._load_riot_path(),))
+        pool.shutdown(wait=False)
+        self._poll_riot_path()
+
+    def _poll_riot_path(self):
+        if self.riot_future is None:  # already collected by _ensure_riot_path
+            return
+        if not self.riot_future.done():
+            self.after(50, self._poll_riot_path)
+            return
+        self._finish_riot_path()
 
-    def _save_riot_path(self, path: str):
+    def _finish_riot_path(self):
+        # Tk-thread side of _resolve_riot_path; also used if a launch can't wait for the next poll
+        if self.riot_future is None:
+            return
         try:
-            with open(RIOT_PATH_FILE, "w", encoding="utf-8") as f:
-                f.write(path)
+            self.riot_path = self.riot_future.result()
         except Exception:
-            pass
+            self.riot_path = ""
+        self.riot_future = None
+        self.riot_path_label.config(text=self._format_riot_path())
 
     def _format_riot_path(self) -> str:
+        if self.riot_path is None:
+            return "Detecting..."
         if not self.riot_path:
             return "Not set"
         if len(self.riot_path) > 48:
@@ -366,15 +884,23 @@ class App(tk.Tk):
         )
         if not selected:
             return
+        if not self.riot_locator.remember(selected):
+            messagebox.showerror("Error", f"Not a valid RiotClientServices.exe:\n{selected}")
+            return
         self.riot_path = selected
-        self._save_riot_path(selected)
         self.riot_path_label.config(text=self._format_riot_path())
         self._set_status("Path saved")
 
     def _ensure_riot_path(self) -> str:
-        if self.riot_path and os.path.exists(self.riot_path):
-            return self.riot_path
-        # Try to prompt user
+        # Let a startup discovery still in flight finish instead of probing twice
+        self._finish_riot_path()
+        path = self.riot_locator.resolve(preferred=(self.riot_path,))
+        if path:
+            if path != self.riot_path:
+                self.riot_path = path
+                self.riot_path_label.config(text=self._format_riot_path())
+            return path
+        # Nothing found automatically: prompt user
         selected = filedialog.askopenfilename(
             title="Locate RiotClientServices.exe",
             filetypes=[("Executable", "*.exe"), ("All files", "*.*")]
@@ -382,33 +908,45 @@ class App(tk.Tk):
         if not selected:
             messagebox.showerror("Path needed", "Please select RiotClientServices.exe.")
             return ""
+        if not self.riot_locator.remember(selected):
+            messagebox.showerror("Error", f"Not a valid RiotClientServices.exe:\n{selected}")
+            return ""
         self.riot_path = selected
-        self._save_riot_path(selected)
         self.riot_path_label.config(text=self._format_riot_path())
         return selected
 
     def _toggle_pw(self):
         self.password_entry.config(show="" if self.show_pw.get() else "*")
 
-    def _refresh_list(self):
-        term = ""
-        try:
-            term = self.search_var.get().strip().lower()
-        except Exception:
-            term = ""
+    def _sync_store(self, seqs):
+        # Patch the store with the rows touched by journal entries `seqs`
+        if self.loader or len(seqs) > STORE_PATCH_LIMIT:
+            self._refresh_list(reload=True)
+            return
+        for rowid, image in self.db.changes(seqs):
+            if image is None:
+                self.store.remove(rowid)
+            else:
+                self.store.upsert(rowid, *image)
+        self._refresh_list()
+
+    def _refresh_list(self, reload: bool = False):
         self.listbox.delete(0, tk.END)
-        self.all_rows = self.db.all()
-        self.rows = [r for r in self.all_rows if term in r[1].lower()]
-        for row in self.rows:
-            self.listbox.insert(tk.END, row[1])  # nickname
+        # Only restores/overrides re-read the whole DB; edits patch the store via _sync_store
+        if reload:
+            self._stop_loading()
+            self.store.load(())
+            for rows in self.db.iter_chunks(STARTUP_CHUNK * 10):
+                self.store.extend(rows)
+        self.view = self.store.view(self._search_term())
+        nicknames = self.store.nicknames
+        if self.view:
+            self.listbox.insert(tk.END, *[nicknames[i] for i in self.view])
         # Auto-select last used account if available
         if self.last_account_id:
-            for idx, row in enumerate(self.rows):
-                if row[0] == self.last_account_id:
-                    self.listbox.selection_set(idx)
-                    self.listbox.see(idx)
-                    self.on_select()
-                    break
+            pos = self.store.position(self.last_account_id)
+            if pos is not None and self._select_pos(pos):
+                self.on_select()
             else:
                 self._set_action_states(enabled=False)
                 self.editing_label.config(text="")
@@ -416,6 +954,79 @@ class App(tk.Tk):
             self._set_action_states(enabled=False)
             self.editing_label.config(text="")
 
+    # ---------- Staged startup ----------
+    def _mark(self, stage: str):
+        if stage not in self.startup_metrics:
+            self.startup_metrics[stage] = (time.perf_counter() - self._t0) * 1000
+
+    def _on_first_expose(self, _evt):
+        # Expose means the window is really on screen (Map fires before anything is drawn)
+        if "first_paint" in self.startup_metrics:
+            return
+        self.update_idletasks()
+        self._mark("first_paint")
+        self.after_idle(self._start_loading)
+
+    def _start_loading(self):
+        # Prefill the last used account by primary key so it is usable before the list is complete
+        row = self.db.get(self.last_account_id) if self.last_account_id else None
+        if row:
+            self._fill_form(*row)
+        self.store.load(())
+        self.view = array("l")
+        self.listbox.delete(0, tk.END)
+        self.loader = self.db.iter_chunks(STARTUP_CHUNK)
+        self._load_next_chunk()
+        self.after_idle(self._resolve_riot_path)
+
+    def _load_next_chunk(self):
+        self.loader_after_id = None
+        rows = next(self.loader, None)
+        if rows is None:
+            self._stop_loading()
+            self._mark("loaded")
+            if STARTUP_METRICS:
+                print("startup: " + ", ".join(f"{k}={v:.0f}ms" for k, v in self.startup_metrics.items())
+                      + f" ({len(self.store)} accounts)", file=sys.stderr)
+            return
+        start = len(self.store)
+        self.store.extend(rows)
+        new = self.store.view(self._search_term(), start)
+        if new:
+            nicknames = self.store.nicknames
+            self.listbox.insert(tk.END, *[nicknames[i] for i in new])
+            self.view.extend(new)
+            if self.current_id and not self.listbox.curselection():
+                for offset, row in enumerate(rows):
+                    if row[0] == self.current_id:
+                        self._select_pos(start + offset)
+                        break
+        self._mark("interactive")
+        self.loader_after_id = self.after(1, self._load_next_chunk)
+
+    def _stop_loading(self):
+        if self.loader_after_id:
+            self.after_cancel(self.loader_after_id)
+            self.loader_after_id = None
+        if self.loader:
+            self.loader.close()
+            self.loader = None
+
+    def _select_pos(self, pos) -> bool:
+        # Select store index `pos` in the listbox if it is in the current view (views are sorted)
+        idx = bisect_left(self.view, pos)
+        if idx >= len(self.view) or self.view[idx] != pos:
+            return False
+        self.listbox.selection_set(idx)
+        self.listbox.see(idx)
+        return True
+
+    def _search_term(self) -> str:
+        try:
+            return self.search_var.get().strip().casefold()
+        except Exception:
+            return ""
+
     def on_select(self, _evt=None):
         sel = self.listbox.curselection()
         if not sel:
@@ -423,8 +1034,9 @@ class App(tk.Tk):
             self.editing_label.config(text="")
             self.current_id = None
             return
-        idx = sel[0]
-        rid, nick, user, pw = self.rows[idx]
+        self._fill_form(*self.store.row(self.view[sel[0]]))
+
+    def _fill_form(self, rid, nick, user, pw):
         self.current_id = rid
         self.nickname_var.set(nick)
         self.username_var.set(user)
@@ -441,12 +1053,13 @@ class App(tk.Tk):
             messagebox.showwarning("Missing fields", "All fields are required.")
             return
         try:
-            self.db.add(nick, user, pw)
+            seq = self.db.add(nick, user, pw)
         except sqlite3.IntegrityError:
             messagebox.showerror("Duplicate", "Nickname already exists.")
             return
+        self._record(seq)
         self.clear_form()
-        self._refresh_list()
+        self._sync_store([seq])
         self._set_status("Added")
 
     def update_account(self):
@@ -460,11 +1073,12 @@ class App(tk.Tk):
             messagebox.showwarning("Missing fields", "All fields are required.")
             return
         try:
-            self.db.update(self.current_id, nick, user, pw)
+            seq = self.db.update(self.current_id, nick, user, pw)
         except sqlite3.IntegrityError:
             messagebox.showerror("Duplicate", "Nickname already exists.")
             return
-        self._refresh_list()
+        self._record(seq)
+        self._sync_store([seq])
         self._set_status("Updated")
 
     def delete_account(self):
@@ -472,12 +1086,93 @@ class App(tk.Tk):
             messagebox.showinfo("Select", "Select an account to delete.")
             return
         if messagebox.askyesno("Confirm", "Delete this account?"):
-            self.db.delete(self.current_id)
+            seq = self.db.delete(self.current_id)
+            self._record(seq)
             self.clear_form()
-            self._refresh_list()
+            self._sync_store([seq])
             self._set_status("Deleted")
             self._set_action_states(enabled=False)
 
+    # ---------- Undo / Redo / Restore ----------
+    def _on_history_key(self, evt, action):
+        # Leave Ctrl+Z/Ctrl+Y alone while typing so they never undo a DB change and clear the form
+        if isinstance(evt.widget, (tk.Entry, ttk.Entry)):
+            return
+        action()
+
+    def _record(self, *seqs: int):
+        # One undo step; may cover several journal entries (e.g. an import)
+        if seqs:
+            self.undo_stack.append(seqs)
+            self.redo_stack.clear()
+
+    def undo(self):
+        if not self.undo_stack:
+            self._set_status("Nothing to undo")
+            return
+        seqs = self.undo_stack[-1]
+        try:
+            done = self.db.revert(seqs)
+        except sqlite3.IntegrityError:
+            messagebox.showerror("Undo failed", "Nickname already exists.")
+            return
+        self.undo_stack.pop()
+        self.redo_stack.append(seqs)
+        self.clear_form()
+        self._sync_store(done)
+        self._set_status("Undone")
+
+    def redo(self):
+        if not self.redo_stack:
+            self._set_status("Nothing to redo")
+            return
+        seqs = self.redo_stack[-1]
+        try:
+            done = self.db.reapply(seqs)
+        except sqlite3.IntegrityError:
+            messagebox.showerror("Redo failed", "Nickname already exists.")
+            return
+        self.redo_stack.pop()
+        self.undo_stack.append(seqs)
+        self.clear_form()
+        self._sync_store(done)
+        self._set_status("Redone")
+
+    def restore_db(self):
+        start = self.db.history_start()
+        if start is None:
+            messagebox.showinfo("Restore database", "No change history recorded yet.")
+            return
+        earliest = time.strftime("%Y-%m-%d %H:%M", time.localtime(start + 60))  # round up to a whole minute
+        when = simpledialog.askstring(
+            "Restore database",
+            f"Restore accounts to their state at (YYYY-MM-DD HH:MM).\n"
+            f"Earliest restorable time: {earliest}",
+            parent=self
+        )
+        if not when:
+            return
+        try:
+            ts = time.mktime(time.strptime(when.strip(), "%Y-%m-%d %H:%M"))
+        except ValueError:
+            messagebox.showerror("Restore failed", "Use the format YYYY-MM-DD HH:MM.")
+            return
+        if not messagebox.askyesno("Confirm", f"Restore accounts to {when.strip()}?"):
+            return
+        try:
+            changed = self.db.restore_to(ts)
+        except ValueError:
+            messagebox.showerror("Restore failed", f"History only goes back to {earliest}.")
+            return
+        except sqlite3.IntegrityError:
+            messagebox.showerror("Restore failed", "Restoring would create a duplicate nickname.")
+            return
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self.clear_form()
+        self._refresh_list(reload=True)
+        self._set_status(f"Restored {changed} account{'' if changed == 1 else 's'}")
+
     def clear_form(self):
         self.nickname_var.set("")
         self.username_var.set("")
@@ -504,32 +1199,29 @@ class App(tk.Tk):
             if choice is None:
                 return
 
+            # open source db (only its accounts; its journal belongs to another vault)
+            src_db = sqlite3.connect(file_path)
+            rows = src_db.execute("SELECT nickname, username, password FROM accounts").fetchall()
+            src_db.close()
+
             if choice:  # append
-                # open source db
-                src_db = sqlite3.connect(file_path)
-                rows = src_db.execute("SELECT nickname, username, password FROM accounts").fetchall()
-                src_db.close()
-                added = 0
+                added = []
                 skipped = 0
                 for nick, user, pw in rows:
                     try:
-                        self.db.add(nick, user, pw)
-                        added += 1
+                        added.append(self.db.add(nick, user, pw))
                     except sqlite3.IntegrityError:
                         skipped += 1
-                self._refresh_list()
+                self._record(*added)  # the whole import is a single undo step
+                self._sync_store(added)
+                added = len(added)
                 messagebox.showinfo("Import complete",
                                     f"Appended {added} entr{'y' if added==1 else 'ies'}; "
                                     f"skipped {skipped} duplicate nickname(s).")
-            else:  # override
-                try:
-                    self.db.conn.close()
-                except Exception:
-                    pass
-                shutil.copy(file_path, DB_PATH)
-                self.db = SimpleDB()
+            else:  # override, journaled as one undo step so Undo or Restore can bring the old accounts back
+                self._record(*self.db.replace_all(rows))
                 self.clear_form()
-                self._refresh_list()
+                self._refresh_list(reload=True)
                 messagebox.showinfo("Import complete", f"Database overridden from:\n{file_path}")
             self._set_status("Imported")
         except Exception as e:
@@ -545,7 +1237,7 @@ class App(tk.Tk):
         if not dest_path:
             return
         try:
-            shutil.copy(DB_PATH, dest_path)
+            self.db.export(dest_path)
             messagebox.showinfo("Export complete", f"Database saved to:\n{dest_path}")
             self._set_status("Exported")
         except Exception as e:
@@ -561,9 +1253,6 @@ class App(tk.Tk):
         path = self._ensure_riot_path()
         if not path:
             return
-        if not os.path.exists(path):
-            messagebox.showerror("Error", f"Riot Client not found at:\n{path}")
-            return
         try:
             subprocess.Popen([path, "--launch-product=valorant", "--launch-patchline=live"])
         except Exception as e:
@@ -0,0 +1,7 @@
+import os
+import sys
+import tempfile
+
+# main.py creates its app-data directory on import; keep it out of the real ProgramData/home
+os.environ.setdefault("PROGRAMDATA", tempfile.mkdtemp())
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,66 @@
+from main import AccountStore, SimpleDB, TextColumn
+
+ROWS = [(3, "alpha", "ua", "pa"), (1, "Bravo", "ub", "pb"), (2, "charlie", "uc", "pc")]
+
+
+def test_extend_and_row():
+    store = AccountStore(ROWS[:1])
+    store.extend(ROWS[1:])
+    assert len(store) == 3
+    assert [store.row(i) for i in range(3)] == ROWS
+
+
+def test_view_filters_case_insensitively():
+    store = AccountStore(ROWS)
+    assert list(store.view()) == [0, 1, 2]
+    assert list(store.view("a")) == [0, 1, 2]
+    assert list(store.view("bra")) == [1]
+    assert list(store.view("zzz")) == []
+
+
+def test_view_from_start_only_covers_new_rows():
+    store = AccountStore(ROWS[:2])
+    store.extend(ROWS[2:])
+    assert list(store.view("", 2)) == [2]
+    assert list(store.view("a", 1)) == [1, 2]
+
+
+def test_view_does_not_match_across_rows():
+    store = AccountStore([(1, "ab", "u", "p"), (2, "cd", "u", "p")])
+    assert list(store.view("bc")) == []
+
+
+def test_position():
+    store = AccountStore(ROWS)
+    assert store.position(1) == 1
+    assert store.position(1) == 1  # memoized
+    assert store.position(3) == 0
+    assert store.position(99) is None
+
+
+def test_upsert_and_remove_keep_nickname_order():
+    db = SimpleDB(":memory:")
+    for nick in ["delta", "Alpha", "charlie"]:
+        db.add(nick, "u", "p")
+    store = AccountStore(db.all())
+
+    db.add("bravo", "u", "p")
+    store.upsert(4, "bravo", "u", "p")
+    db.update(1, "Echo", "u2", "p2")
+    store.upsert(1, "Echo", "u2", "p2")
+    db.delete(3)
+    store.remove(3)
+
+    assert [store.row(i) for i in range(len(store))] == db.all()
+    assert store.position(1) == 2
+    assert list(store.view("ech")) == [2]
+
+
+def test_text_column_insert_pop():
+    col = TextColumn(["aa", "b", "ccc"])
+    col.insert(1, "xy")
+    assert [col[i] for i in range(len(col))] == ["aa", "xy", "b", "ccc"]
+    col.pop(0)
+    col.pop(2)
+    assert [col[i] for i in range(len(col))] == ["xy", "b"]
+    assert list(col.find("b")) == [1]
@@ -0,0 +1,123 @@
+import sqlite3
+
+import pytest
+
+import main
+from main import SimpleDB
+
+
+@pytest.fixture
+def db():
+    return SimpleDB(":memory:")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() for journal timestamps."""
+    now = [1_700_000_000.0]
+    monkeypatch.setattr(main.time, "time", lambda: now[0])
+    return now
+
+
+def nicknames(db):
+    return [row[1] for row in db.all()]
+
+
+def test_restore_across_nickname_swap(db, clock):
+    db.add("alpha", "ua", "pa")
+    db.add("beta", "ub", "pb")
+    checkpoint = clock[0]
+    clock[0] += 60
+    # Swap the two nicknames via a temporary name, then delete and re-add one of them
+    db.update(1, "tmp", "ua", "pa")
+    db.update(2, "alpha", "ub", "pb")
+    db.update(1, "beta", "ua", "pa")
+    db.delete(2)
+    db.add("alpha", "new", "new")
+
+    assert db.restore_to(checkpoint) == 3
+    assert db.all() == [(1, "alpha", "ua", "pa"), (2, "beta", "ub", "pb")]
+
+
+def test_restore_before_history_start_raises(db, clock):
+    with pytest.raises(ValueError):
+        db.restore_to(clock[0])  # no history at all yet
+    db.add("x", "u", "p")
+    with pytest.raises(ValueError):
+        db.restore_to(db.history_start() - 1)
+
+
+def test_restore_rejects_compacted_history(db, clock):
+    day = 86400
+    clock[0] -= 40 * day
+    db.add("x", "u", "p")
+    clock[0] += 7 * day
+    db.update(1, "y", "u", "p")
+    clock[0] += 33 * day
+    db.update(1, "z", "u", "p")
+    db.compact()
+    with pytest.raises(ValueError):
+        db.restore_to(clock[0] - 35 * day)
+    assert nicknames(db) == ["z"]
+
+
+def test_undo_redo_round_trip_keeps_id(db, clock):
+    db.add("keep", "u", "p")
+    seq = db.delete(1)
+    assert db.all() == []
+    db.revert([seq])
+    assert db.all() == [(1, "keep", "u", "p")]
+    db.reapply([seq])
+    assert db.all() == []
+    db.revert([seq])
+    assert db.get(1) == (1, "keep", "u", "p")
+
+
+def test_multi_entry_undo_is_one_step(db, clock):
+    seqs = [db.add(f"n{i}", "u", "p") for i in range(3)]
+    db.revert(seqs)
+    assert db.all() == []
+    db.reapply(seqs)
+    assert nicknames(db) == ["n0", "n1", "n2"]
+
+
+def test_failed_undo_rolls_back_whole_step(db, clock):
+    db.add("a", "u", "p")
+    db.add("b", "u", "p")
+    seqs = [db.delete(1), db.delete(2)]
+    db.add("a", "other", "other")  # nickname taken again
+    with pytest.raises(sqlite3.IntegrityError):
+        db.revert(seqs)
+    # "b" is restored before "a" collides; the transaction must undo that too
+    assert db.all() == [(3, "a", "other", "other")]
+
+
+def test_undo_import_override_through_restore(db, clock):
+    db.add("mine", "u1", "p1")
+    db.add("also mine", "u2", "p2")
+    checkpoint = clock[0]
+    clock[0] += 60
+    db.replace_all([("theirs", "x", "y")])
+    assert nicknames(db) == ["theirs"]
+
+    db.restore_to(checkpoint)
+    assert db.all() == [(2, "also mine", "u2", "p2"), (1, "mine", "u1", "p1")]
+
+
+def test_undo_import_override_as_one_step(db, clock):
+    db.add("mine", "u1", "p1")
+    seqs = db.replace_all([("mine", "x", "y"), ("theirs", "x", "y")])
+    db.revert(seqs)
+    assert db.all() == [(1, "mine", "u1", "p1")]
+
+
+def test_export_has_no_journal(db, clock, tmp_path):
+    db.add("gone", "secret", "secret")
+    db.delete(1)
+    db.add("kept", "u", "p")
+    out = tmp_path / "export.db"
+    db.export(str(out))
+    conn = sqlite3.connect(out)
+    assert conn.execute("SELECT nickname FROM accounts").fetchall() == [("kept",)]
+    assert conn.execute("SELECT name FROM sqlite_master WHERE name='journal'").fetchall() == []
+    conn.close()
@@ -0,0 +1,109 @@
+import json
+
+from main import RiotLocator
+
+EXE = r"C:\Riot Games\Riot Client\RiotClientServices.exe"
+CUSTOM = r"D:\Games\Riot Client\RiotClientServices.exe"
+MANIFEST = r"C:\ProgramData\Riot Games\RiotClientInstalls.json"
+CACHE = "/cache/riot_path_cache.json"
+ENV = {"PROGRAMDATA": r"C:\ProgramData", "ProgramFiles": r"C:\Program Files", "SystemDrive": "C:"}
+
+
+class FakeFS:
+    """In-memory Windows-style tree: path -> (size, mtime_ns), plus text files."""
+
+    def __init__(self, files=None, texts=None):
+        self.files = dict(files or {})
+        self.texts = dict(texts or {})
+        self.stats = []
+
+    def stat(self, path):
+        self.stats.append(path)
+        return self.files.get(path)
+
+    def read_text(self, path):
+        return self.texts.get(path)
+
+    def write_text(self, path, text):
+        self.texts[path] = text
+
+
+def make(fs):
+    return RiotLocator(fs, CACHE, env=ENV)
+
+
+def test_known_paths_are_windows_paths():
+    paths = make(FakeFS()).known_paths()
+    assert r"C:\Program Files\Riot Games\Riot Client\RiotClientServices.exe" in paths
+    assert r"C:\Riot Games\Riot Client\RiotClientServices.exe" in paths
+    assert all("/" not in p for p in paths)
+
+
+def test_manifest_wins_over_known_locations():
+    fs = FakeFS({EXE: (10, 1), CUSTOM: (10, 1)},
+                {MANIFEST: json.dumps({"rc_default": "D:/Games/Riot Client/RiotClientServices.exe"})})
+    assert make(fs).resolve() == CUSTOM
+    assert json.loads(fs.texts[CACHE]) == {"path": CUSTOM, "size": 10, "mtime_ns": 1}
+
+
+def test_falls_back_to_known_location():
+    fs = FakeFS({EXE: (10, 1)})
+    assert make(fs).resolve() == EXE
+
+
+def test_nothing_found():
+    assert make(FakeFS()).resolve() == ""
+
+
+def test_cached_hit_is_a_single_stat():
+    fs = FakeFS({EXE: (10, 1)})
+    make(fs).resolve()
+    fs.stats.clear()
+    assert make(fs).resolve() == EXE  # fresh locator reads the cache file
+    assert fs.stats == [EXE]
+
+
+def test_changed_metadata_is_revalidated_and_recached():
+    fs = FakeFS({EXE: (10, 1)})
+    locator = make(fs)
+    locator.resolve()
+    fs.files[EXE] = (12, 2)
+    assert locator.resolve() == EXE
+    assert json.loads(fs.texts[CACHE])["size"] == 12
+
+
+def test_invalid_cached_file_triggers_discovery():
+    fs = FakeFS({CUSTOM: (10, 1), EXE: (10, 1)})
+    locator = make(fs)
+    assert locator.remember(CUSTOM)
+    fs.files[CUSTOM] = (0, 2)  # truncated
+    assert locator.resolve() == EXE
+
+
+def test_remember_rejects_wrong_exe():
+    fs = FakeFS({r"C:\Windows\notepad.exe": (10, 1)})
+    assert not make(fs).remember(r"C:\Windows\notepad.exe")
+    assert CACHE not in fs.texts
+
+
+def test_miss_is_cached_until_manifest_changes():
+    fs = FakeFS({MANIFEST: (5, 1)}, {MANIFEST: "{}"})
+    locator = make(fs)
+    assert locator.resolve() == ""
+    fs.stats.clear()
+    assert make(fs).resolve() == ""  # fresh locator reads the cached miss
+    assert fs.stats == [MANIFEST]
+
+    # Riot installs and rewrites its manifest
+    fs.files[CUSTOM] = (10, 1)
+    fs.files[MANIFEST] = (60, 2)
+    fs.texts[MANIFEST] = json.dumps({"rc_default": "D:/Games/Riot Client/RiotClientServices.exe"})
+    assert locator.resolve() == CUSTOM
+
+
+def test_remember_replaces_cached_miss():
+    fs = FakeFS({CUSTOM: (10, 1)})
+    locator = make(fs)
+    assert locator.resolve() == ""
+    assert locator.remember(CUSTOM)
+    assert locator.resolve() == CUSTOM